@@ -56,15 +56,24 @@ function initExportDocs(base, mode, prefix) {
 function parseCSV(text) {
     const lines = text.trim().replace(/\r\n/g, '\n').replace(/\r/g, '\n').split('\n');
     const headers = parseCSVLine(lines[0]);
-    return lines.slice(1).filter(line => line.trim()).map(line => {
-        const values = parseCSVLine(line);
+    const rows = [];
+    for (let i = 1; i < lines.length; i++) {
+        if (!lines[i].trim()) continue;
+        const values = parseCSVLine(lines[i]);
+        // Assign columns in header order so every row shares one object
+        // shape and downstream property reads stay monomorphic.
         const obj = {};
-        headers.forEach((h, i) => obj[h] = values[i] || '');
-        return obj;
-    });
+        for (let j = 0; j < headers.length; j++) obj[headers[j]] = values[j] || '';
+        rows.push(obj);
+    }
+    return rows;
 }
 
 function parseCSVLine(line) {
+    // Most lines contain no quoted fields; splitting on commas is then
+    // equivalent to the stateful scan below and much cheaper.
+    if (line.indexOf('"') === -1) return line.split(',');
+
     const result = [];
     let current = '';
     let inQuotes = false;
@@ -92,66 +101,100 @@ function parseCSVLine(line) {
 // DATA LOADING
 // =============================================================================
 
+/**
+ * Annotate field rows with derived type info (_isArray, _baseType) so the
+ * renderers don't re-parse the '[]' suffix per use.
+ */
+function annotateFields(fields) {
+    for (const f of fields) {
+        const ftype = f.type || '';
+        f._isArray = ftype.endsWith('[]');
+        f._baseType = f._isArray ? ftype.slice(0, -2) : ftype;
+    }
+    return fields;
+}
+
 async function loadExportData(basePath = '') {
     const prefix = basePath ? basePath + '/' : '';
-    const [objectsRes, fieldsRes, enumValuesRes] = await Promise.all([
-        fetch(`${prefix}objects.csv`),
-        fetch(`${prefix}fields.csv`),
-        fetch(`${prefix}enum_values.csv`)
+    const loadCsv = name => fetch(prefix + name).then(res => res.text()).then(parseCSV);
+    const [objects, fields, enumValues] = await Promise.all([
+        loadCsv('objects.csv'),
+        loadCsv('fields.csv').then(annotateFields),
+        loadCsv('enum_values.csv')
     ]);
-    return {
-        objects: parseCSV(await objectsRes.text()),
-        fields: parseCSV(await fieldsRes.text()),
-        enumValues: parseCSV(await enumValuesRes.text())
-    };
+    return { objects, fields, enumValues };
 }
 
 // =============================================================================
 // UTILITIES
 // =============================================================================
 
+const ESCAPE_RE = /[&<>"]/g;
+const ESCAPE_MAP = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;' };
+
 function escapeHtml(str) {
-    return str.replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;').replace(/"/g, '&quot;');
+    return str.replace(ESCAPE_RE, ch => ESCAPE_MAP[ch]);
+}
+
+// Memoized variant for hot loops: field names, type strings and
+// descriptions recur across rows and across the renderers, and the
+// datasets are static for the lifetime of the page.
+const escapeCache = new Map();
+function escapeHtmlCached(str) {
+    let out = escapeCache.get(str);
+    if (out === undefined) escapeCache.set(str, out = escapeHtml(str));
+    return out;
 }
 
 function groupBy(arr, keyFn) {
+    const getKey = typeof keyFn === 'string' ? item => item[keyFn] : keyFn;
     const result = {};
     for (const item of arr) {
-        const key = typeof keyFn === 'string' ? item[keyFn] : keyFn(item);
-        if (!result[key]) result[key] = [];
-        result[key].push(item);
+        const key = getKey(item);
+        (result[key] || (result[key] = [])).push(item);
     }
     return result;
 }
 
-function buildParentMap(fields, objectNames) {
-    const parentMap = {};
-    for (const field of fields) {
-        const ftype = field.type || '';
-        const fname = field.json_name || '';
-        const parentObj = field.object || '';
-        if (!fname) continue;
-        const isArray = ftype.endsWith('[]');
-        const baseType = isArray ? ftype.slice(0, -2) : ftype;
-        if (objectNames.has(baseType)) {
-            parentMap[baseType] = { parent: parentObj, field: fname, isArray };
-        }
-    }
-    return parentMap;
-}
-
-function computeJsonPath(objName, parentMap) {
+function computeJsonPath(objName, parentMap, cache = {}) {
     if (objName === 'Site' || objName === 'Location') return 'sites[]';
-    if (!parentMap[objName]) return '';
-    const { parent, field, isArray } = parentMap[objName];
-    const parentPath = computeJsonPath(parent, parentMap);
-    return `${parentPath}.${field}${isArray ? '[]' : ''}`;
+    if (objName in cache) return cache[objName];
+
+    // Walk up to the root (or the nearest cached ancestor), then build the
+    // paths back down so each object on the chain costs one concatenation
+    // and lands in the cache.
+    const chain = [];
+    let cur = objName;
+    let path;
+    for (;;) {
+        if (cur === 'Site' || cur === 'Location') { path = 'sites[]'; break; }
+        if (cur in cache) { path = cache[cur]; break; }
+        if (!parentMap[cur]) { path = ''; break; }
+        chain.push(cur);
+        cur = parentMap[cur].parent;
+    }
+    while (chain.length) {
+        const obj = chain.pop();
+        const { field, isArray } = parentMap[obj];
+        path = `${path}.${field}${isArray ? '[]' : ''}`;
+        cache[obj] = path;
+    }
+    return path;
 }
 
 // =============================================================================
 // CSV FORMAT RENDERER
 // =============================================================================
 
+// Static blocks built once at script load rather than per render.
+const CSV_OVERVIEW_HTML = `<div class="section" id="overview">
+            <h2>Overview</h2>
+            <p>The CSV export produces <strong>one row per depth interval per site</strong>. Site-level fields repeat on each row.</p>
+        </div>`;
+
+const DEPTH_INTERVAL_DESC_HTML =
+    '<p class="description">One row per depth interval. Intervals are determined by the site\'s depth interval preset.</p>';
+
 function getCsvSections(data) {
     const { objects, fields } = data;
     // Build lookup: object name -> csv_name
@@ -162,7 +205,9 @@ function getCsvSections(data) {
         }
     }
 
-    // Get unique objects that have CSV columns, in order of first appearance
+    // Get unique objects that have CSV columns, in order of first appearance.
+    // The anchor id is derived here once; both the nav and the section
+    // headings reference it.
     const csvFields = fields.filter(f => f.csv_column);
     const seen = new Set();
     const sections = [];
@@ -170,7 +215,7 @@ function getCsvSections(data) {
         const obj = f.object;
         if (obj && !seen.has(obj)) {
             seen.add(obj);
-            sections.push([obj, csvNameMap[obj] || obj]);
+            sections.push([obj, csvNameMap[obj] || obj, obj.toLowerCase()]);
         }
     }
     return sections;
@@ -179,96 +224,106 @@ function getCsvSections(data) {
 function renderCsvNav(data, container, jsonFormatHref = '/json-export-format/') {
     const sections = getCsvSections(data);
 
-    let html = '<a href="#overview">Overview</a> ';
-    for (const [objName, displayName] of sections) {
-        html += `<a href="#csv-${objName.toLowerCase()}">${displayName}</a> `;
-    }
-    html += `<span class="muted" style="margin-left: 1em;">See also: <a href="${jsonFormatHref}">JSON Format</a></span>`;
-    container.innerHTML = html;
+    const navItems = sections.map(([, displayName, anchor]) =>
+        `<a href="#csv-${anchor}">${displayName}</a>`);
+    container.innerHTML = [
+        '<a href="#overview">Overview</a>',
+        ...navItems,
+        `<span class="muted" style="margin-left: 1em;">See also: <a href="${jsonFormatHref}">JSON Format</a></span>`
+    ].join(' ');
 }
 
 function renderCsvDocs(data, container, options = {}) {
     const { fields, enumValues } = data;
     const { showOverview = true } = options;
 
-    // Group enum values by enum (use labels for CSV)
+    // Escaped, comma-joined label list per enum (CSV docs show labels),
+    // built once instead of per row that references the enum.
     const valuesByEnum = groupBy(enumValues, 'enum');
+    const enumLabelHtml = {};
+    for (const enumName in valuesByEnum) {
+        enumLabelHtml[enumName] = valuesByEnum[enumName].map(v => escapeHtmlCached(v.label)).join(', ');
+    }
 
     // Get fields with CSV columns, grouped by object
     const csvFields = fields.filter(f => f.csv_column);
     const fieldsByObject = groupBy(csvFields, 'object');
     const sections = getCsvSections(data);
 
-    let html = '';
+    const parts = [];
     if (showOverview) {
-        html += `<div class="section" id="overview">
-            <h2>Overview</h2>
-            <p>The CSV export produces <strong>one row per depth interval per site</strong>. Site-level fields repeat on each row.</p>
-        </div>`;
+        parts.push(CSV_OVERVIEW_HTML);
     }
 
-    for (const [objName, displayName] of sections) {
+    for (const [objName, displayName, anchor] of sections) {
         const objFields = fieldsByObject[objName] || [];
         if (!objFields.length) continue;
 
-        let tableRows = '';
+        const rows = [];
         for (const f of objFields) {
             const csvCol = f.csv_column || '';
             const ftype = f.type || '';
             const fdesc = f.description || '';
 
             let typeHtml;
-            if (valuesByEnum[ftype]) {
-                const vals = valuesByEnum[ftype].map(v => escapeHtml(v.label));
-                typeHtml = vals.join(', ');
+            if (ftype in enumLabelHtml) {
+                typeHtml = enumLabelHtml[ftype];
             } else if (ftype === 'boolean') {
                 typeHtml = 'TRUE, FALSE';
             } else {
-                typeHtml = escapeHtml(ftype);
+                typeHtml = escapeHtmlCached(ftype);
             }
 
-            tableRows += `<tr><td>${escapeHtml(csvCol)}</td><td>${typeHtml}</td><td>${escapeHtml(fdesc)}</td></tr>`;
+            rows.push('<tr><td>', escapeHtmlCached(csvCol), '</td><td>', typeHtml, '</td><td>', escapeHtmlCached(fdesc), '</td></tr>');
         }
 
-        const descHtml = objName === 'DepthInterval'
-            ? '<p class="description">One row per depth interval. Intervals are determined by the site\'s depth interval preset.</p>'
-            : '';
+        const descHtml = objName === 'DepthInterval' ? DEPTH_INTERVAL_DESC_HTML : '';
 
-        html += `<div class="section" id="csv-${objName.toLowerCase()}">
+        parts.push(`<div class="section" id="csv-${anchor}">
             <h2>${displayName}</h2>
             ${descHtml}
             <table>
                 <thead><tr><th>CSV Column</th><th>Type</th><th>Description</th></tr></thead>
-                <tbody>${tableRows}</tbody>
+                <tbody>${rows.join('')}</tbody>
             </table>
-        </div>`;
+        </div>`);
     }
 
-    container.innerHTML = html;
+    container.innerHTML = parts.join('');
 }
 
 // =============================================================================
 // JSON TREE RENDERER
 // =============================================================================
 
+// Static shell around the structure block in full (non-minimal) mode,
+// built once at script load.
+const TREE_SHELL_PREFIX = `
+            <h2>JSON Structure</h2>
+            <p>The export API returns site data with the following structure. Click field names to jump to documentation.</p>
+            <pre><code>`;
+const TREE_SHELL_SUFFIX = `</code></pre>
+            <p>Fields starting with <code>_</code> are derived fields expanded by the export.</p>
+        `;
+
 function buildJsonTree(data) {
     const { objects, fields } = data;
     const objectNames = new Set(objects.map(o => o.name));
 
-    // Build children map: parent -> [{field, childType, isArray}]
+    // Build children map: parent -> [{field, childType, isArray}].
+    // Buckets are created up front from the object list so the field loop
+    // and the render walk always hit existing keys.
     const children = {};
+    for (const o of objects) children[o.name] = [];
     for (const f of fields) {
         const fname = f.json_name;
-        const ftype = f.type || '';
         const parent = f.object;
         if (!fname) continue;
 
-        const isArray = ftype.endsWith('[]');
-        const baseType = isArray ? ftype.slice(0, -2) : ftype;
+        const { _isArray: isArray, _baseType: baseType } = f;
 
         if (objectNames.has(baseType)) {
-            if (!children[parent]) children[parent] = [];
-            children[parent].push({ field: fname, childType: baseType, isArray });
+            (children[parent] || (children[parent] = [])).push({ field: fname, childType: baseType, isArray });
         }
     }
     return children;
@@ -278,31 +333,32 @@ function renderJsonTree(data, container, options = {}) {
     const children = buildJsonTree(data);
     const { minimal = false } = options;
 
-    const link = (name, obj, isArray = false) =>
-        `<a href="#obj-${obj.toLowerCase()}">${name}${isArray ? '[]' : ''}</a>`;
+    // Lowercase each object name once; link() runs per node and object
+    // names repeat throughout the tree.
+    const anchorIds = {};
+    for (const o of data.objects) anchorIds[o.name] = o.name.toLowerCase();
 
-    function renderNode(objName, fieldName, isArray, indent) {
-        const prefix = '  '.repeat(indent);
-        let html = prefix + link(fieldName, objName, isArray);
+    const link = (name, obj, isArray = false) =>
+        `<a href="#obj-${anchorIds[obj]}">${name}${isArray ? '[]' : ''}</a>`;
 
+    // Collect one line per node into a flat list and join once, instead of
+    // concatenating subtree strings at every level of the recursion.
+    function collectNode(objName, fieldName, isArray, indent, lines) {
+        lines.push('  '.repeat(indent) + link(fieldName, objName, isArray));
         const objChildren = children[objName] || [];
         for (const child of objChildren) {
-            html += '\n' + renderNode(child.childType, child.field, child.isArray, indent + 1);
+            collectNode(child.childType, child.field, child.isArray, indent + 1, lines);
         }
-        return html;
     }
 
-    const structureHtml = renderNode('Site', 'sites', true, 0);
+    const lines = [];
+    collectNode('Site', 'sites', true, 0, lines);
+    const structureHtml = lines.join('\n');
 
     if (minimal) {
         container.innerHTML = `<pre><code>${structureHtml}</code></pre>`;
     } else {
-        container.innerHTML = `
-            <h2>JSON Structure</h2>
-            <p>The export API returns site data with the following structure. Click field names to jump to documentation.</p>
-            <pre><code>${structureHtml}</code></pre>
-            <p>Fields starting with <code>_</code> are derived fields expanded by the export.</p>
-        `;
+        container.innerHTML = TREE_SHELL_PREFIX + structureHtml + TREE_SHELL_SUFFIX;
     }
 }
 
@@ -314,77 +370,103 @@ function renderJsonFields(data, container) {
     const { objects, fields, enumValues } = data;
     const objectNames = new Set(objects.map(o => o.name));
 
-    // Group fields by object
-    const fieldsByObject = groupBy(fields, 'object');
+    // Anchor ids derive from object names; lowercase each once instead of
+    // per section heading and per type-cell reference.
+    const anchorIds = {};
+    for (const o of objects) anchorIds[o.name] = o.name.toLowerCase();
+
+    // Object-typed cells emit identical link markup wherever the same type
+    // is referenced; render each object's link once up front.
+    const objRefHtml = {};
+    for (const o of objects) {
+        objRefHtml[o.name] = `<a href="#obj-${anchorIds[o.name]}">${escapeHtml(o.name)}</a>`;
+    }
+
+    // Group JSON-exported fields by object and build the parent map used for
+    // path computation in a single pass — fields is the largest dataset, and
+    // rows without a json_name never render on this page.
+    const jsonFieldsByObject = {};
+    const parentMap = {};
+    for (const f of fields) {
+        const fname = f.json_name;
+        if (!fname) continue;
+        const obj = f.object || '';
+        (jsonFieldsByObject[obj] || (jsonFieldsByObject[obj] = [])).push(f);
+
+        const { _isArray: isArray, _baseType: baseType } = f;
+        if (objectNames.has(baseType)) {
+            parentMap[baseType] = { parent: obj, field: fname, isArray };
+        }
+    }
 
     // Merge Location into Site
-    if (fieldsByObject.Location && fieldsByObject.Site) {
-        fieldsByObject.Site.push(...fieldsByObject.Location);
-        delete fieldsByObject.Location;
+    if (jsonFieldsByObject.Location && jsonFieldsByObject.Site) {
+        jsonFieldsByObject.Site.push(...jsonFieldsByObject.Location);
+        delete jsonFieldsByObject.Location;
     }
 
-    // Group enum values
+    // Escaped, comma-joined value list per enum, built once instead of per
+    // row that references the enum.
     const valuesByEnum = groupBy(enumValues, 'enum');
+    const enumValueHtml = {};
+    for (const enumName in valuesByEnum) {
+        enumValueHtml[enumName] = valuesByEnum[enumName].map(v => escapeHtmlCached(v.value)).join(', ');
+    }
 
-    const parentMap = buildParentMap(fields, objectNames);
-    const isJsonField = f => !!f.json_name;
+    const pathCache = {};
 
     // Filter objects with JSON fields
     const jsonObjects = objects.filter(obj => {
         if (obj.name === 'Location') return false;
-        const objFields = fieldsByObject[obj.name] || [];
-        return objFields.some(isJsonField);
+        const objFields = jsonFieldsByObject[obj.name];
+        return !!(objFields && objFields.length);
     });
 
-    let html = '';
+    const parts = [];
 
     for (const obj of jsonObjects) {
         const name = obj.name;
         const desc = obj.description || '';
-        const path = computeJsonPath(name, parentMap);
-        const objFields = (fieldsByObject[name] || []).filter(isJsonField);
-
-        if (!objFields.length) continue;
+        const path = computeJsonPath(name, parentMap, pathCache);
+        // jsonObjects only contains objects with a non-empty field list.
+        const objFields = jsonFieldsByObject[name];
 
-        let tableRows = '';
+        const rows = [];
         for (const f of objFields) {
             const fname = f.json_name || '';
-            const ftype = f.type || '';
             const fdesc = f.description || '';
 
-            const isArray = ftype.endsWith('[]');
-            const baseType = isArray ? ftype.slice(0, -2) : ftype;
-            const fnameHtml = `<code>${escapeHtml(fname)}${isArray ? '[]' : ''}</code>`;
+            const { _isArray: isArray, _baseType: baseType } = f;
+            const fnameHtml = `<code>${escapeHtmlCached(fname)}${isArray ? '[]' : ''}</code>`;
 
             let typeHtml;
-            if (valuesByEnum[baseType]) {
-                const vals = valuesByEnum[baseType].map(v => escapeHtml(v.value));
-                typeHtml = vals.join(', ');
+            if (baseType in enumValueHtml) {
+                typeHtml = enumValueHtml[baseType];
             } else if (baseType === 'boolean') {
                 typeHtml = 'true, false';
             } else if (baseType === 'datetime') {
                 typeHtml = 'ISO 8601 DateTime';
             } else if (objectNames.has(baseType)) {
-                typeHtml = `<a href="#obj-${baseType.toLowerCase()}">${escapeHtml(baseType)}</a>`;
+                typeHtml = objRefHtml[baseType];
             } else {
-                typeHtml = escapeHtml(baseType);
+                typeHtml = escapeHtmlCached(baseType);
             }
 
-            tableRows += `<tr><td>${fnameHtml}</td><td>${typeHtml}</td><td>${escapeHtml(fdesc)}</td></tr>`;
+            rows.push('<tr><td>', fnameHtml, '</td><td>', typeHtml, '</td><td>', escapeHtmlCached(fdesc), '</td></tr>');
         }
 
-        html += `<div class="section" id="obj-${name.toLowerCase()}">
+        parts.push(`<div class="section" id="obj-${anchorIds[name]}">
             <h2>${escapeHtml(name)}</h2>
             ${desc ? `<p class="description">${escapeHtml(desc)}</p>` : ''}
             ${path ? `<p class="muted">JSON path: <code>${escapeHtml(path)}</code></p>` : ''}
             <table>
                 <thead><tr><th>Field</th><th>Type</th><th>Description</th></tr></thead>
-                <tbody>${tableRows}</tbody>
+                <tbody>${rows.join('')}</tbody>
             </table>
-        </div>`;
+        </div>`);
     }
 
-    container.innerHTML = html;
+    container.innerHTML = parts.join('');
 }
 
 // =============================================================================
@@ -396,47 +478,39 @@ function renderHierarchy(data, container) {
     const objectNames = new Set(objects.map(o => o.name));
     const objectDesc = Object.fromEntries(objects.map(o => [o.name, o.description]));
 
-    // Group enum values
-    const valuesByEnum = {};
-    for (const val of enumValues) {
-        const enumName = val.enum || '';
-        if (!valuesByEnum[enumName]) valuesByEnum[enumName] = [];
-        valuesByEnum[enumName].push(val.value || '');
+    // Display HTML per base type, computed once so the field loop below is a
+    // single lookup instead of an if/else chain per field. The two literal
+    // entries contain no markup characters, so only enum values (CSV data)
+    // need escaping, and that happens here rather than per row.
+    const valuesByEnum = groupBy(enumValues, 'enum');
+    const typeDisplayMap = { boolean: 'true, false', datetime: 'ISO 8601 DateTime' };
+    for (const enumName in valuesByEnum) {
+        typeDisplayMap[enumName] = escapeHtml(valuesByEnum[enumName].map(v => v.value || '').join(', '));
     }
 
-    // Build children and primitives maps
+    // Build children and primitives maps, with buckets created up front
+    // from the object list so the common case below is a key hit.
     const children = {};
     const primitives = {};
+    for (const o of objects) {
+        children[o.name] = [];
+        primitives[o.name] = [];
+    }
 
     for (const field of fields) {
-        const ftype = field.type || '';
         const fname = field.json_name || '';
         const parent = field.object || '';
         const fdesc = field.description || '';
 
         if (!fname) continue;
 
-        const isArray = ftype.endsWith('[]');
-        const baseType = isArray ? ftype.slice(0, -2) : ftype;
+        const { _isArray: isArray, _baseType: baseType } = field;
 
         if (objectNames.has(baseType)) {
-            if (!children[parent]) children[parent] = [];
-            children[parent].push({ fname, childType: baseType, isArray });
+            (children[parent] || (children[parent] = [])).push({ fname, childType: baseType, isArray });
         } else {
-            // Compute display type
-            let typeDisplay;
-            if (valuesByEnum[baseType]) {
-                typeDisplay = valuesByEnum[baseType].join(', ');
-            } else if (baseType === 'boolean') {
-                typeDisplay = 'true, false';
-            } else if (baseType === 'datetime') {
-                typeDisplay = 'ISO 8601 DateTime';
-            } else {
-                typeDisplay = baseType;
-            }
-
-            if (!primitives[parent]) primitives[parent] = [];
-            primitives[parent].push({ fname, typeDisplay, fdesc });
+            const typeHtml = baseType in typeDisplayMap ? typeDisplayMap[baseType] : escapeHtmlCached(baseType);
+            (primitives[parent] || (primitives[parent] = [])).push({ fname, typeHtml, fdesc });
         }
     }
 
@@ -446,13 +520,21 @@ function renderHierarchy(data, container) {
         delete primitives.Location;
     }
 
-    // Color palette
-    const colors = ['#e8f5e9', '#fff3e0', '#e3f2fd', '#fce4ec', '#f3e5f5', '#e0f7fa', '#fff8e1', '#efebe9'];
-    const borderColors = ['#4caf50', '#ff9800', '#2196f3', '#e91e63', '#9c27b0', '#00bcd4', '#ffc107', '#795548'];
+    // Walk the tree with an explicit stack instead of recursion, pushing
+    // fragments into one flat list. String entries are emitted verbatim
+    // (closing tags queued behind a node's children); object entries are
+    // nodes still to be opened.
+    const parts = [];
+    const stack = [{ objName: 'Site', fieldName: 'sites', isArray: true, depth: 0 }];
+
+    while (stack.length) {
+        const entry = stack.pop();
+        if (typeof entry === 'string') {
+            parts.push(entry);
+            continue;
+        }
 
-    function renderNode(objName, fieldName = null, isArray = false, depth = 0) {
-        const color = colors[depth % colors.length];
-        const border = borderColors[depth % borderColors.length];
+        const { objName, fieldName, isArray, depth } = entry;
         const desc = objectDesc[objName] || '';
 
         let label = fieldName || objName;
@@ -460,34 +542,34 @@ function renderHierarchy(data, container) {
 
         // Primitive fields table
         let fieldsHtml = '';
-        if (primitives[objName]) {
+        if (primitives[objName] && primitives[objName].length) {
             const rows = primitives[objName].map(p =>
-                `<tr><td class="pfield-name">${escapeHtml(p.fname)}</td>` +
-                `<td class="pfield-type">${escapeHtml(p.typeDisplay)}</td>` +
-                `<td class="pfield-desc">${escapeHtml(p.fdesc)}</td></tr>`
+                `<tr><td class="pfield-name">${escapeHtmlCached(p.fname)}</td>` +
+                `<td class="pfield-type">${p.typeHtml}</td>` +
+                `<td class="pfield-desc">${escapeHtmlCached(p.fdesc)}</td></tr>`
             ).join('');
             fieldsHtml = `<table class="fields">${rows}</table>`;
         }
 
-        // Child objects
-        let childHtml = '';
-        if (children[objName]) {
-            const items = children[objName].map(c =>
-                renderNode(c.childType, c.fname, c.isArray, depth + 1)
-            ).join('');
-            childHtml = `<div class="children">${items}</div>`;
-        }
-
-        return `<div class="node" style="background: ${color}; border-color: ${border};">
+        parts.push(`<div class="node d${depth & 7}">
             <div class="header">
                 <span class="field-name">${label}</span>
                 <span class="type-name">${objName}</span>
             </div>
-            ${desc ? `<div class="desc">${escapeHtml(desc)}</div>` : ''}
-            ${fieldsHtml}
-            ${childHtml}
-        </div>`;
+            ${desc ? `<div class="desc">${escapeHtmlCached(desc)}</div>` : ''}
+            ${fieldsHtml}`);
+
+        stack.push('</div>');
+        const objChildren = children[objName];
+        if (objChildren && objChildren.length) {
+            stack.push('</div>');
+            for (let i = objChildren.length - 1; i >= 0; i--) {
+                const c = objChildren[i];
+                stack.push({ objName: c.childType, fieldName: c.fname, isArray: c.isArray, depth: depth + 1 });
+            }
+            stack.push('<div class="children">');
+        }
     }
 
-    container.innerHTML = renderNode('Site', 'sites', true, 0);
+    container.innerHTML = parts.join('');
 }